@@ -1,10 +1,10 @@
-import csv
-import io
-import json
+import gzip
 import logging
 import random
 import threading
 import time
+
+import numpy as np
 from flask import Flask, Response, request, jsonify
 
 from .config import (
@@ -13,11 +13,23 @@ from .config import (
 )
 from .simulator import generate_snapshot, Snapshot
 
+try:
+    import orjson
+
+    def _dumps(obj: dict) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:  # stdlib fallback
+    import json
+
+    def _dumps(obj: dict) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
 # Logging
 class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
+        now = record.created  # already sampled by logging; no extra clock reads
         payload = {
-            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime()) + f".{int(time.time()*1000)%1000:03d}Z",
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now)) + f".{int(now*1000)%1000:03d}Z",
             "level": record.levelname,
             "svc": "data-sim",
             "event": getattr(record, "event", "log"),
@@ -25,7 +37,7 @@ class JsonFormatter(logging.Formatter):
         }
         for k, v in getattr(record, "extra_fields", {}).items():
             payload[k] = v
-        return json.dumps(payload, ensure_ascii=False)
+        return _dumps(payload)
 
 def setup_logging():
     root = logging.getLogger()
@@ -36,46 +48,58 @@ def setup_logging():
     root.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
 
 # App state
+# Serializes publishers only; readers never take it.
 _lock = threading.Lock()
-# Start with an empty placeholder; we generate a real snapshot at startup.
-_snapshot: Snapshot = (0, 0, [], {})
+# (snapshot, CSV body, gzipped CSV body), rebound as one tuple so a reader always
+# sees a matching set without locking. Start with an empty placeholder; we
+# generate a real snapshot at startup.
+_published: tuple[Snapshot, bytes, bytes] = ((0, 0, [], [], np.empty((0, 0))), b"", b"")
 _stop = threading.Event()
+# Fault settings are fixed at import, so the common no-fault case skips the RNG.
+_FAULT_ENABLED = FAULT_500_PCT > 0 or FAULT_SLOW_MS > 0
+
+def _refresh_snapshot() -> Snapshot:
+    """Generate the next snapshot and its CSV bodies, then publish them together."""
+    global _published
+    with _lock:
+        snap = generate_snapshot(DATA_SWITCHES, _published[0][0])
+        body = _to_csv(snap).encode("utf-8")
+        _published = (snap, body, gzip.compress(body, compresslevel=1))
+    return snap
 
 def _generator_loop():
     """Background loop that refreshes the snapshot every DATA_INTERVAL_SEC."""
-    global _snapshot
     log = logging.getLogger(__name__)
-    last_tick = time.time()
+    last_tick = time.monotonic_ns()
     while not _stop.is_set():
-        t0 = time.time()
-        with _lock:
-            _snapshot = generate_snapshot(DATA_SWITCHES, _snapshot[0])
-            sid, ts_ms, fields, rows = _snapshot
-        tick_ms = int((time.time() - t0) * 1000)
-        skew_ms = int((time.time() - last_tick - DATA_INTERVAL_SEC) * 1000)
-        last_tick = time.time()
-        log.info(
-            "snapshot refreshed",
-            extra={"event": "gen.tick", "extra_fields": {
-                "tick_ms": tick_ms,
-                "interval_ms": DATA_INTERVAL_SEC * 1000,
-                "skew_ms": skew_ms,
-                "switches": DATA_SWITCHES,
-                "metrics_per_switch": len(_snapshot[2]),
-                "snapshot_id": str(_snapshot[0]),
-            }},
-        )
+        t0 = time.monotonic_ns()
+        snap = _refresh_snapshot()
+        now = time.monotonic_ns()
+        tick_ms = (now - t0) // 1_000_000
+        skew_ms = (now - last_tick) // 1_000_000 - DATA_INTERVAL_SEC * 1000
+        last_tick = now
+        if log.isEnabledFor(logging.INFO):
+            log.info(
+                "snapshot refreshed",
+                extra={"event": "gen.tick", "extra_fields": {
+                    "tick_ms": tick_ms,
+                    "interval_ms": DATA_INTERVAL_SEC * 1000,
+                    "skew_ms": skew_ms,
+                    "switches": DATA_SWITCHES,
+                    "metrics_per_switch": len(snap[2]),
+                    "snapshot_id": str(snap[0]),
+                }},
+            )
         _stop.wait(DATA_INTERVAL_SEC)
 
 def _to_csv(s: Snapshot) -> str:
-    """Serialize the snapshot to a CSV matrix."""
-    sid, ts_ms, fields, rows = s
-    buf = io.StringIO()
-    w = csv.writer(buf)
-    w.writerow(["switch_id"] + fields)
-    for sw, vals in rows.items():
-        w.writerow([sw] + [vals[k] for k in fields])
-    return buf.getvalue()
+    """Serialize the snapshot to a CSV matrix (IDs and numbers only, so no quoting)."""
+    sid, ts_ms, fields, switch_ids, values = s
+    fmt = ",".join(["%.2f"] * len(fields))
+    lines = ["switch_id," + ",".join(fields)]
+    lines.extend(sw + "," + fmt % tuple(row) for sw, row in zip(switch_ids, values.tolist()))
+    lines.append("")
+    return "\n".join(lines)
 
 def create_app() -> Flask:
     setup_logging()
@@ -83,9 +107,7 @@ def create_app() -> Flask:
 
     # Generate an initial snapshot immediately so the first request already
     # has the correct (simulator-driven) metric header and rows.
-    global _snapshot
-    with _lock:
-        _snapshot = generate_snapshot(DATA_SWITCHES, _snapshot[0])
+    _refresh_snapshot()
 
     # Start generator thread (only once)
     if not getattr(app, "_gen_started", False):
@@ -96,54 +118,61 @@ def create_app() -> Flask:
     @app.get("/counters")
     def counters():
         log = logging.getLogger(__name__)
-        t0 = time.time()
+        t0 = time.monotonic_ns()
 
         # Fault injection: occasional 500 or jitter delay
-        if FAULT_500_PCT > 0 and random.randint(1, 100) <= FAULT_500_PCT:
-            if FAULT_SLOW_MS > 0:
+        if _FAULT_ENABLED:
+            if FAULT_500_PCT > 0 and random.random() * 100 < FAULT_500_PCT:
+                if FAULT_SLOW_MS > 0:
+                    time.sleep(FAULT_SLOW_MS / 1000.0)
+                log.warning(
+                    "injecting 500",
+                    extra={"event": "gen.inject_fault", "extra_fields": {"fault": "500"}},
+                )
+                return jsonify({"error": "injected failure"}), 500
+
+            if FAULT_SLOW_MS > 0 and random.random() < 0.2:
+                # Delay ~20% of requests to simulate jitter
                 time.sleep(FAULT_SLOW_MS / 1000.0)
-            log.warning(
-                "injecting 500",
-                extra={"event": "gen.inject_fault", "extra_fields": {"fault": "500"}},
-            )
-            return jsonify({"error": "injected failure"}), 500
-
-        if FAULT_SLOW_MS > 0 and random.random() < 0.2:
-            # Delay ~20% of requests to simulate jitter
-            time.sleep(FAULT_SLOW_MS / 1000.0)
-
-        with _lock:
-            sid, ts_ms, fields, rows = _snapshot
-            etag = str(sid)
 
-            # ETag / If-None-Match support
-            inm = request.headers.get("If-None-Match")
-            if inm and inm == etag:
-                resp = Response(status=304)
-                resp.headers["ETag"] = etag
-                resp.headers["X-Snapshot-Ts"] = str(ts_ms)
-                resp.headers["Cache-Control"] = "no-store"
-                return resp
-
-            csv_text = _to_csv(_snapshot)
-
-        resp = Response(csv_text, mimetype="text/csv; charset=utf-8")
+        snap, body, body_gz = _published
+        sid, ts_ms = snap[0], snap[1]
+        etag = str(sid)
+
+        # ETag / If-None-Match support
+        inm = request.headers.get("If-None-Match")
+        if inm and inm == etag:
+            resp = Response(status=304)
+            resp.headers["ETag"] = etag
+            resp.headers["X-Snapshot-Ts"] = str(ts_ms)
+            resp.headers["Cache-Control"] = "no-store"
+            return resp
+
+        # Serve the pre-compressed body to clients that accept it
+        if request.accept_encodings["gzip"]:
+            body = body_gz
+            resp = Response(body, mimetype="text/csv; charset=utf-8")
+            resp.headers["Content-Encoding"] = "gzip"
+        else:
+            resp = Response(body, mimetype="text/csv; charset=utf-8")
+        resp.headers["Vary"] = "Accept-Encoding"
         resp.headers["ETag"] = etag
         resp.headers["X-Snapshot-Ts"] = str(ts_ms)
         resp.headers["Cache-Control"] = "no-store"
 
-        latency_ms = int((time.time() - t0) * 1000)
-        log.info(
-            "serve /counters",
-            extra={"event": "http.access", "extra_fields": {
-                "path": "/counters",
-                "status": 200,
-                "latency_ms": latency_ms,
-                "bytes_sent": len(csv_text),
-                "age_ms": int(time.time() * 1000) - ts_ms,
-                "snapshot_id": etag,
-            }},
-        )
+        latency_ms = (time.monotonic_ns() - t0) // 1_000_000
+        if log.isEnabledFor(logging.INFO):
+            log.info(
+                "serve /counters",
+                extra={"event": "http.access", "extra_fields": {
+                    "path": "/counters",
+                    "status": 200,
+                    "latency_ms": latency_ms,
+                    "bytes_sent": len(body),
+                    "age_ms": time.time_ns() // 1_000_000 - ts_ms,
+                    "snapshot_id": etag,
+                }},
+            )
         return resp
 
     @app.get("/health")
@@ -1,25 +1,25 @@
-import math
-import random
+import sys
 from time import time
 
-MetricRow = dict[str, float]
-Snapshot  = tuple[int, int, list[str], dict[str, MetricRow]]  # (snapshot_id, ts_ms, fields, rows)
+import numpy as np
+
+# (snapshot_id, ts_ms, fields, switch_ids, values); values is (len(switch_ids), len(fields))
+Snapshot = tuple[int, int, list[str], list[str], np.ndarray]
+
+# One generator per process; every metric is drawn as a batch of n_switches.
+rng = np.random.default_rng()
+
+# Switch IDs only depend on the fleet size, so they are formatted once per size.
+_SWITCH_IDS_CACHE: dict[int, list[str]] = {}
 
 def _fmt_id(i: int) -> str:
     return f"sw-{i:03d}"
 
-def _poisson_small(lam: float) -> int:
-    """Return a small non-negative count (≈ Poisson for small lambda)."""
-    L = math.exp(-lam)
-    k = 0
-    p = 1.0
-    while p > L:
-        k += 1
-        p *= random.random()
-    return max(0, k - 1)
-
-def _clip(x: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, x))
+def _switch_ids(n: int) -> list[str]:
+    ids = _SWITCH_IDS_CACHE.get(n)
+    if ids is None:
+        ids = _SWITCH_IDS_CACHE[n] = [sys.intern(_fmt_id(i)) for i in range(n)]
+    return ids
 
 def generate_snapshot(n_switches: int, prev_id: int) -> Snapshot:
     """
@@ -35,6 +35,7 @@ def generate_snapshot(n_switches: int, prev_id: int) -> Snapshot:
     """
     snapshot_id = prev_id + 1
     ts_ms = int(time() * 1000)
+    n = n_switches
 
     fields = [
         "bandwidth_gbps",
@@ -47,57 +48,51 @@ def generate_snapshot(n_switches: int, prev_id: int) -> Snapshot:
         "temperature_c",
     ]
 
-    rows: dict[str, MetricRow] = {}
-    for i in range(n_switches):
-        # 1) Bandwidth
-        bw = max(0.0, random.gauss(120.0, 15.0))
-
-        # 2) Latency with occasional spikes
-        if random.random() < 0.03:
-            lat = random.uniform(50.0, 150.0)
-        else:
-            lat = max(1.0, random.gauss(10.0, 2.0))
-
-        # 3) Packet errors: mostly tiny counts, rare bursts
-        if random.random() < 0.01:
-            pkt_errs = random.randint(5, 30)
-        else:
-            pkt_errs = _poisson_small(0.6)
-
-        # 4) CPU utilization with occasional high spikes
-        if random.random() < 0.05:
-            cpu = random.uniform(80.0, 100.0)
-        else:
-            cpu = _clip(random.gauss(35.0, 10.0), 0.0, 100.0)
-
-        # 5) Memory utilization
-        mem = _clip(random.gauss(60.0, 15.0), 0.0, 100.0)
-
-        # 6) Buffer occupancy with microbursts
-        if random.random() < 0.08:
-            buf = random.uniform(70.0, 100.0)
-        else:
-            buf = _clip(random.gauss(30.0, 15.0), 0.0, 100.0)
-
-        # 7) Egress drops: correlate a bit with high buffers, but keep it simple
-        if random.random() < 0.02:
-            drops = random.uniform(100.0, 1000.0)
-        else:
-            lam = 1.0 + (buf / 100.0) * 0.5
-            drops = float(_poisson_small(lam))
-
-        # 8) Temperature correlates with CPU a bit
-        temp = _clip(random.gauss(45.0, 3.0) + 0.06 * cpu, 30.0, 90.0)
-
-        rows[_fmt_id(i)] = {
-            "bandwidth_gbps": round(bw, 2),
-            "latency_us": round(lat, 2),
-            "packet_errors": float(pkt_errs),
-            "cpu_util_pct": round(cpu, 2),
-            "mem_util_pct": round(mem, 2),
-            "buffer_occupancy_pct": round(buf, 2),
-            "egress_drops_per_s": round(drops, 2),
-            "temperature_c": round(temp, 2),
-        }
-
-    return (snapshot_id, ts_ms, fields, rows)
+    # 1) Bandwidth
+    bw = rng.normal(120.0, 15.0, n).clip(min=0.0)
+
+    # 2) Latency with occasional spikes
+    lat = np.where(
+        rng.random(n) < 0.03,
+        rng.uniform(50.0, 150.0, n),
+        rng.normal(10.0, 2.0, n).clip(min=1.0),
+    )
+
+    # 3) Packet errors: mostly tiny counts, rare bursts
+    pkt_errs = np.where(
+        rng.random(n) < 0.01,
+        rng.integers(5, 31, n),
+        rng.poisson(0.6, n),
+    ).astype(np.float64)
+
+    # 4) CPU utilization with occasional high spikes
+    cpu = np.where(
+        rng.random(n) < 0.05,
+        rng.uniform(80.0, 100.0, n),
+        rng.normal(35.0, 10.0, n).clip(0.0, 100.0),
+    )
+
+    # 5) Memory utilization
+    mem = rng.normal(60.0, 15.0, n).clip(0.0, 100.0)
+
+    # 6) Buffer occupancy with microbursts
+    buf = np.where(
+        rng.random(n) < 0.08,
+        rng.uniform(70.0, 100.0, n),
+        rng.normal(30.0, 15.0, n).clip(0.0, 100.0),
+    )
+
+    # 7) Egress drops: correlate a bit with high buffers, but keep it simple
+    drops = np.where(
+        rng.random(n) < 0.02,
+        rng.uniform(100.0, 1000.0, n),
+        rng.poisson(1.0 + (buf / 100.0) * 0.5),
+    )
+
+    # 8) Temperature correlates with CPU a bit
+    temp = (rng.normal(45.0, 3.0, n) + 0.06 * cpu).clip(30.0, 90.0)
+
+    switch_ids = _switch_ids(n)
+    values = np.column_stack((bw, lat, pkt_errs, cpu, mem, buf, drops, temp)).round(2)
+
+    return (snapshot_id, ts_ms, fields, switch_ids, values)
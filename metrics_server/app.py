@@ -3,8 +3,9 @@ import os
 import time
 import logging
 
-from fastapi import FastAPI, HTTPException, Query, Request
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 
 from .logging import setup_logging
 from .poller import Poller
@@ -27,40 +28,41 @@ PORT = int_env("PORT", 8080)
 # App and State
 setup_logging("metrics-api", LOG_LEVEL)
 log = logging.getLogger(__name__)
-app = FastAPI(title="Fabric Telemetry (metrics server)")
+app = FastAPI(title="Fabric Telemetry (metrics server)", default_response_class=ORJSONResponse)
 
 store = SnapshotStore()
 poller = Poller(UPSTREAM_URL, POLL_MS, store)
 stats = RollingStats(capacity=1000)
-started_at = time.time()
+started_at = time.monotonic()
 
 # Access log + latency
 @app.middleware("http")
 async def access_logger(request: Request, call_next):
-    t0 = time.time()
+    t0 = time.monotonic_ns()
     try:
         response = await call_next(request)
         return response
     finally:
-        latency_ms = int((time.time() - t0) * 1000)
+        latency_ms = (time.monotonic_ns() - t0) // 1_000_000
         path = request.url.path
         stats.add(path, latency_ms)
-        # age header if we have data
-        age_ms: int | None = await store.age_ms()
-        log.info(
-            "access",
-            extra={
-                "event": "http.access",
-                "extra_fields": {
-                    "path": path,
-                    "method": request.method,
-                    "latency_ms": latency_ms,
-                    "status": getattr(request.state, "status_code", None)
-                    or getattr(locals().get("response", None), "status_code", None),
-                    "age_ms": age_ms if age_ms is not None else -1,
+        if log.isEnabledFor(logging.INFO):
+            # age header if we have data
+            age_ms: int | None = await store.age_ms()
+            log.info(
+                "access",
+                extra={
+                    "event": "http.access",
+                    "extra_fields": {
+                        "path": path,
+                        "method": request.method,
+                        "latency_ms": latency_ms,
+                        "status": getattr(request.state, "status_code", None)
+                        or getattr(locals().get("response", None), "status_code", None),
+                        "age_ms": age_ms if age_ms is not None else -1,
+                    },
                 },
-            },
-        )
+            )
 
 # Startup/Shutdown
 @app.on_event("startup")
@@ -89,6 +91,24 @@ async def _current_snapshot():
 def _staleness(ts_ms: int) -> int:
     return int(time.time() * 1000) - ts_ms
 
+def _list_metrics_parts(s) -> tuple[bytes, bytes]:
+    """
+    Serialized ListMetrics body around `age_ms`, cached per snapshot_id.
+    Everything but the age is fixed for a snapshot, so it is encoded once.
+    """
+    cached = store.list_metrics_cache
+    if cached and cached[0] == s.meta.snapshot_id:
+        return cached[1], cached[2]
+    keys = ("switch_id", *s.meta.fields)
+    items: list[dict[str, object]] = [
+        dict(zip(keys, (sw, *vals))) for sw, vals in zip(s.switch_ids, s.values.tolist())
+    ]
+    # b'{"snapshot_id":"…"' and b'"fields":[…],"items":[…]}'
+    head = orjson.dumps({"snapshot_id": s.meta.snapshot_id})[:-1]
+    tail = orjson.dumps({"fields": s.meta.fields, "items": items})[1:]
+    store.list_metrics_cache = (s.meta.snapshot_id, head, tail)
+    return head, tail
+
 # Endpoints
 @app.get("/telemetry/GetMetric")
 async def get_metric(
@@ -96,13 +116,15 @@ async def get_metric(
     metric: str = Query(..., description="Metric name, e.g., bandwidth_gbps"),
 ):
     s = await _current_snapshot()
-    if switch_id not in s.data:
+    row = s.switch_index.get(switch_id)
+    if row is None:
         raise HTTPException(status_code=404, detail=f"Unknown switch_id '{switch_id}'.")
-    if metric not in s.meta.fields:
+    col = s.field_index.get(metric)
+    if col is None:
         raise HTTPException(
             status_code=404, detail=f"Unknown metric '{metric}'. Available: {s.meta.fields}"
         )
-    value = s.data[switch_id].get(metric)
+    value = float(s.values[row, col])
     age_ms = _staleness(s.meta.ts_ms)
     resp = {
         "switch_id": switch_id,
@@ -111,29 +133,22 @@ async def get_metric(
         "snapshot_id": s.meta.snapshot_id,
         "age_ms": age_ms,
     }
-    return JSONResponse(resp, headers={"X-Data-Age-Ms": str(age_ms), "ETag": s.meta.snapshot_id})
+    return ORJSONResponse(resp, headers={"X-Data-Age-Ms": str(age_ms), "ETag": s.meta.snapshot_id})
 
 @app.get("/telemetry/ListMetrics")
-async def list_metrics():
+async def list_metrics(request: Request):
     s = await _current_snapshot()
     age_ms = _staleness(s.meta.ts_ms)
-    items: list[dict[str, object]] = []
-    for sw, vals in s.data.items():
-        obj: dict[str, object] = {"switch_id": sw}
-        obj.update(vals)
-        items.append(obj)
-    resp = {
-        "snapshot_id": s.meta.snapshot_id,
-        "age_ms": age_ms,
-        "fields": s.meta.fields,
-        "items": items,
-    }
-    return JSONResponse(resp, headers={"X-Data-Age-Ms": str(age_ms), "ETag": s.meta.snapshot_id})
+    headers = {"X-Data-Age-Ms": str(age_ms), "ETag": s.meta.snapshot_id}
+    if request.headers.get("If-None-Match") == s.meta.snapshot_id:
+        return Response(status_code=304, headers=headers)
+    head, tail = _list_metrics_parts(s)
+    body = b"%s,\"age_ms\":%d,%s" % (head, age_ms, tail)
+    return Response(body, media_type="application/json", headers=headers)
 
 @app.get("/stats")
 async def stats_endpoint():
-    now = time.time()
-    uptime_s = int(now - started_at)
+    uptime_s = int(time.monotonic() - started_at)
     # simple lat/percentiles for main endpoints
     lm = stats.percentiles("/telemetry/ListMetrics")
     gm = stats.percentiles("/telemetry/GetMetric")
@@ -1,14 +1,25 @@
-import json
 import logging
 import time
 
+try:
+    import orjson
+
+    def _dumps(obj: dict) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:  # stdlib fallback
+    import json
+
+    def _dumps(obj: dict) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
 class JsonFormatter(logging.Formatter):
     def __init__(self, service: str):
         super().__init__()
         self.service = service
 
     def format(self, record: logging.LogRecord) -> str:
-        ts = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime()) + f".{int(time.time()*1000)%1000:03d}Z"
+        now = record.created  # already sampled by logging; no extra clock reads
+        ts = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now)) + f".{int(now*1000)%1000:03d}Z"
         payload = {
             "ts": ts,
             "level": record.levelname,
@@ -18,7 +29,7 @@ class JsonFormatter(logging.Formatter):
         }
         for k, v in getattr(record, "extra_fields", {}).items():
             payload[k] = v
-        return json.dumps(payload, ensure_ascii=False)
+        return _dumps(payload)
 
 def setup_logging(service_name: str, level_name: str = "INFO"):
     root = logging.getLogger()
@@ -1,6 +1,10 @@
 import math
 from collections import deque
 
+import numpy as np
+
+_PCTS = (0.50, 0.95, 0.99)
+
 class RollingStats:
     """Keep last N latencies (ms) per endpoint and compute p50/p95/p99 on demand."""
     def __init__(self, capacity: int = 1000):
@@ -15,19 +19,15 @@ class RollingStats:
         dq = self.map.get(key, deque())
         if not dq:
             return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0, "count": 0}
-        arr = sorted(dq)
-        n = len(arr)
-
-        def pick(p: float) -> float:
-            if n == 0:
-                return 0.0
-            idx = max(0, min(n - 1, math.ceil(p * n) - 1))
-            return float(arr[idx])
-
+        n = len(dq)
+        arr = np.fromiter(dq, dtype=np.int64, count=n)
+        # Only the ranks we report need to be in place, so a partial sort is enough.
+        idx = [max(0, min(n - 1, math.ceil(p * n) - 1)) for p in _PCTS]
+        part = np.partition(arr, idx + [n - 1])
         return {
-            "p50": pick(0.50),
-            "p95": pick(0.95),
-            "p99": pick(0.99),
-            "max": float(arr[-1]),
+            "p50": float(part[idx[0]]),
+            "p95": float(part[idx[1]]),
+            "p99": float(part[idx[2]]),
+            "max": float(part[n - 1]),
             "count": n,
         }
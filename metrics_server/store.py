@@ -1,6 +1,7 @@
-import asyncio
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+import numpy as np
 
 @dataclass
 class SnapshotMeta:
@@ -11,25 +12,33 @@ class SnapshotMeta:
 @dataclass
 class Snapshot:
     meta: SnapshotMeta
-    data: dict[str, dict[str, float]]  # switch_id -> metric -> value
+    switch_ids: list[str]
+    values: np.ndarray  # (len(switch_ids), len(meta.fields)), row per switch
+    switch_index: dict[str, int] = field(init=False)  # switch_id -> row
+    field_index: dict[str, int] = field(init=False)  # metric -> column
+
+    def __post_init__(self):
+        self.switch_index = {sw: i for i, sw in enumerate(self.switch_ids)}
+        self.field_index = {name: i for i, name in enumerate(self.meta.fields)}
 
 class SnapshotStore:
     def __init__(self):
-        self._lock = asyncio.Lock()
+        # Snapshots are never mutated after construction and the reference is
+        # swapped in one assignment, so readers see either the old or the new
+        # snapshot and no lock is needed.
         self._snap: Snapshot | None = None
+        # (snapshot_id, head, tail) of the serialized ListMetrics body; see app.py.
+        self.list_metrics_cache: tuple[str, bytes, bytes] | None = None
 
     async def set(self, snap: Snapshot) -> None:
-        async with self._lock:
-            self._snap = snap
+        self._snap = snap
+        self.list_metrics_cache = None
 
     async def get(self) -> Snapshot | None:
-        # lock-free read would be okay if we guarantee atomic assignment;
-        # here we keep it simple and consistent.
-        async with self._lock:
-            return self._snap
+        return self._snap
 
     async def age_ms(self) -> int | None:
-        s = await self.get()
+        s = self._snap
         if not s:
             return None
         return int(time.time() * 1000) - s.meta.ts_ms